@@ -1,8 +1,230 @@
+import functools
+import io
+import os
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
+#matplotlib.pyplot is slow to import, so it is imported inside the plotting functions only
 
-def create_record_csv_poke(name_of_csv):
+#National Dex csv file shipped in scripts_and_files, read with explicit dtypes to skip type inference
+NATIONAL_DEX_CSV = 'pokemon_dex_num.csv'
+NATIONAL_DEX_DTYPES = {'NAME': 'string', 'national_dex_num': 'int32'}
+
+#Columns of your record of cards, in the order they are saved
+RECORD_COLUMNS = ['nat_dex_num', 'pokemon_name', 'set_name', 'foil_flag', 'full_art_flag', 'url']
+
+#Record columns with only a handful of repeated values are stored as categories (small int codes instead of strings)
+RECORD_DTYPES = {'set_name': 'category', 'foil_flag': 'category', 'full_art_flag': 'category'}
+
+#Answers counted as "yes" at the prompts, compared after .casefold() so any capitalization works
+_YES = frozenset({"y", "yes", "yup", "yeah", "yep"})
+
+#csv files at least this big are parsed with the multithreaded pyarrow engine, smaller ones parse faster with the C engine
+PYARROW_MIN_BYTES = 1 << 20
+
+@functools.lru_cache(maxsize=8)
+def _load_csv_cached(path, mtime, size, dtype_items):
+    #dtype is passed as a tuple of items since lru_cache needs hashable arguments
+    dtype = dict(dtype_items) if dtype_items else None
+    if os.path.getsize(path) >= PYARROW_MIN_BYTES:
+        try:
+            return pd.read_csv(path, dtype=dtype, engine='pyarrow')
+        except (ImportError, ValueError):
+            pass #pyarrow not installed (or too old for these options), fall back to the C engine
+    return pd.read_csv(path, dtype=dtype)
+
+def load_csv(path, dtype=None):
+    """
+    Reads a csv file into a DataFrame, reusing the parsed result if the file has not changed since the last read.
+    The cache is keyed by the path and the file's modification time and size, so saving the file invalidates it
+    (the size also catches a rewrite that lands within the filesystem's timestamp resolution).
+    Large files (see PYARROW_MIN_BYTES) are parsed with pyarrow when it is installed.
+
+    Args:
+        path (str): The filename of the csv file to read (including '.csv').
+        dtype (dict): Optional column -> dtype mapping passed to pd.read_csv.
+
+    Returns:
+        pd.DataFrame: A copy of the parsed DataFrame (safe to modify).
+    """
+    stat = os.stat(path)
+    dtype_items = tuple(sorted(dtype.items())) if dtype else None
+    return _load_csv_cached(path, stat.st_mtime_ns, stat.st_size, dtype_items).copy()
+
+@functools.lru_cache(maxsize=2)
+def _build_dex_lookups(path, mtime, size):
+    national_dex_df = _load_csv_cached(path, mtime, size, tuple(sorted(NATIONAL_DEX_DTYPES.items())))
+    #Keep the first row for each name/number, which is the base form (Mega and other forms come after it)
+    dex_by_name = {}
+    dex_by_num = {}
+    for dex_num, name in zip(national_dex_df['national_dex_num'], national_dex_df['NAME']):
+        if pd.isna(name):
+            continue
+        #Names are keyed case-insensitively and keep their spelling from the csv file
+        dex_by_name.setdefault(str(name).casefold(), (str(name), int(dex_num)))
+        dex_by_num.setdefault(int(dex_num), str(name))
+    return dex_by_name, dex_by_num
+
+def load_dex():
+    """
+    Loads the National Dex csv file (NATIONAL_DEX_CSV) as two lookup dicts, so finding a Pokemon is a single
+    hash lookup instead of a scan over the whole dex. They are built once and reused until the file changes.
+    The dicts are shared between calls, so don't modify them.
+
+    Returns:
+        tuple:
+            - dex_by_name (dict): Casefolded Pokemon name (name.casefold()) -> (Pokemon name as spelled in the
+                                  National Dex, National Dex number).
+            - dex_by_num (dict): National Dex number -> Pokemon name.
+    """
+    stat = os.stat(NATIONAL_DEX_CSV)
+    return _build_dex_lookups(NATIONAL_DEX_CSV, stat.st_mtime_ns, stat.st_size)
+
+def load_record(record_name):
+    """
+    Reads your record of cards. Records saved as Feather ('.feather') are read with pd.read_feather,
+    anything else is treated as a csv file. The set and flag columns are loaded as categories (see RECORD_DTYPES).
+
+    Args:
+        record_name (str): The filename of your record (including '.csv' or '.feather').
+
+    Returns:
+        pd.DataFrame: The df of your record of cards.
+    """
+    if record_name.endswith('.feather'):
+        return pd.read_feather(record_name).astype(RECORD_DTYPES)
+    return load_csv(record_name, dtype=RECORD_DTYPES)
+
+def save_record(record_df, record_name):
+    """
+    Saves your record of cards, using Feather if the filename ends in '.feather' and csv otherwise.
+    Feather is a binary columnar format that is much faster to write than csv for large records.
+
+    Args:
+        record_df (pd.DataFrame): The df of your record of cards.
+        record_name (str): The filename of your record (including '.csv' or '.feather').
+
+    Returns:
+        None (saves the record to your computer)
+    """
+    if record_name.endswith('.feather'):
+        record_df.reset_index(drop=True).to_feather(record_name) #feather only supports the default index
+    else:
+        record_df.to_csv(record_name, index=False)
+    return None
+
+def append_to_record_file(rows, record_name):
+    """
+    Writes new cards to the end of the record on disk. csv records are opened in append mode so only the
+    new rows are written, instead of rewriting every card already saved. Feather files can't be appended
+    to, so those are read and saved again in full.
+
+    Args:
+        rows (list of dict): The cards to add, keyed by column name (see RECORD_COLUMNS).
+        record_name (str): The filename of your record (including '.csv' or '.feather').
+
+    Returns:
+        None (updates the record on your computer)
+    """
+    if record_name.endswith('.feather'):
+        save_record(append_record_rows(load_record(record_name), rows), record_name)
+        return None
+
+    #If the file was edited by hand and lost its final newline, the first new row would join the last line
+    needs_newline = False
+    with open(record_name, 'rb') as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b'\n'
+
+    #The record has a fixed set of text/integer columns, so the rows are formatted directly rather than
+    #building a DataFrame and going through pandas' csv writer
+    with open(record_name, 'a', encoding='utf-8') as f:
+        if needs_newline:
+            f.write('\n')
+        for row in rows:
+            _write_record_row(f, row)
+    return None
+
+def _csv_field(value):
+    #Same output as to_csv: missing values are left empty and fields with commas, quotes or newlines are quoted
+    if pd.isna(value) is True:
+        return ''
+    text = str(value)
+    if any(char in text for char in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _write_record_row(f, row):
+    f.write(','.join(_csv_field(row.get(col)) for col in RECORD_COLUMNS) + '\n')
+
+def export_record_csv(record_name):
+    """
+    Exports a Feather record to a human-readable csv file with the same base name, e.g. as a backup
+    or to open it in a spreadsheet.
+
+    Args:
+        record_name (str): The filename of your Feather record (including '.feather').
+
+    Returns:
+        str: The filename of the exported csv file.
+    """
+    csv_name = os.path.splitext(record_name)[0] + '.csv'
+    load_record(record_name).to_csv(csv_name, index=False)
+    return csv_name
+
+def build_record_index(record_df, column):
+    """
+    Builds a lookup dict from the values of a column to their row position, so repeated lookups are a
+    single hash instead of a full-column scan. If a value appears more than once, the first row is kept.
+
+    Args:
+        record_df (pd.DataFrame): The df to index.
+        column (str): The column whose values become the keys (e.g. 'pokemon_name' or 'nat_dex_num').
+
+    Returns:
+        dict: Maps each value in the column to its integer row position (for use with .iloc/.iat).
+    """
+    record_index = {}
+    for row_pos, key in enumerate(record_df[column]):
+        record_index.setdefault(key, row_pos)
+    return record_index
+
+def set_record_value(record_df, row_pos, column, value):
+    """
+    Sets a single cell of the record in place, adding the value as a new category first if the column is
+    categorical and has not seen it before (pandas refuses to set unknown categories).
+
+    Args:
+        record_df (pd.DataFrame): The df of your record of cards.
+        row_pos (int): The row position of the card (see build_record_index).
+        column (str): The column to update.
+        value: The new value.
+
+    Returns:
+        None (record_df is modified in place)
+    """
+    column_values = record_df[column]
+    if isinstance(column_values.dtype, pd.CategoricalDtype) and value not in column_values.cat.categories:
+        record_df[column] = column_values.cat.add_categories([value])
+    record_df.iat[row_pos, record_df.columns.get_loc(column)] = value
+    return None
+
+def append_record_rows(record_df, rows):
+    """
+    Appends new rows to the record with a single pd.concat. Setting rows one at a time with
+    record_df.loc[len(record_df)] goes through pandas' slow enlargement path and copies the frame per row.
+
+    Args:
+        record_df (pd.DataFrame): The df of your record of cards.
+        rows (list of dict): The rows to append, keyed by column name.
+
+    Returns:
+        pd.DataFrame: A new DataFrame with the rows appended.
+    """
+    new_rows_df = pd.DataFrame(rows, columns=record_df.columns)
+    return pd.concat([record_df, new_rows_df], ignore_index=True)
+
+def create_record_csv_poke(name_of_csv, file_format='csv'):
     """
     Creates a new CSV file with the specified name containing an empty Pokémon card DataFrame 
     with the following columns: 'pokemon_name', 'nat_dex_num', 'set', 'foil_flag', 'full_art_flag', 'url'
@@ -12,14 +234,25 @@ def create_record_csv_poke(name_of_csv):
 
     Args:
         name_of_csv (str): The base name (without .csv extension) to use for the new CSV file.
+        file_format (str): 'csv' (default) or 'feather'. Feather records save faster but are not human-readable,
+                           use export_record_csv to get a csv copy.
 
     Returns:
         None (saves a csv file to your computer)
     """
-    record_df = pd.DataFrame(columns = ['nat_dex_num', 'pokemon_name', 'set_name', 'foil_flag', 'full_art_flag', 'url'])
-    record_df.to_csv('{}.csv'.format(name_of_csv), index=False)
+    record_name = '{}.{}'.format(name_of_csv, file_format)
+    if file_format == 'csv':
+        #An empty csv record is just the header line, so write it directly instead of going through a DataFrame
+        with open(record_name, 'w', newline='') as f:
+            f.write(','.join(RECORD_COLUMNS) + '\n')
+    else:
+        record_df = pd.DataFrame(columns = RECORD_COLUMNS)
+        save_record(record_df, record_name)
     return None
 
+#(row, col) of each board position 1-9, reading left to right, top to bottom (index 0 is unused)
+_BOARD_POSITIONS = (None,) + tuple(divmod(n - 1, 3) for n in range(1, 10))
+
 def num_to_position(num):
     """
     Convert a board position number (1–9) to a (row, col) tuple.
@@ -37,19 +270,19 @@ def num_to_position(num):
     #Convert 1–9 to (row, col) position, reading left to right, top to bottom
     if not (1 <= num <= 9):
         raise ValueError("Number must be between 1 and 9.")
-    row = (num - 1) // 3
-    col = (num - 1) % 3
-    return row, col
+    return _BOARD_POSITIONS[num]
 
-def show_board_with_star(star_position, page_num):
+#Cached 3x3 board (figure, axes and current star) so the grid and numbers are only drawn once
+_BOARD = {}
+
+def _build_board():
     """
-    Display a 3x3 board with a single yellow star at the given position.
-    Each cell also shows its position number faintly for reference.
+    Draw the static part of the 3x3 board: the grid lines and the faint position numbers 1-9.
 
-    Args:
-        star_position (int): The board position (1–9) where the star should appear.
-        page_num (int): The page number the card should be in, for reference.
+    Returns:
+        tuple: (fig, ax) of the new board.
     """
+    import matplotlib.pyplot as plt
 
     #First set up board
     fig, ax = plt.subplots()
@@ -74,28 +307,120 @@ def show_board_with_star(star_position, page_num):
                     fontsize=16, color='gray', alpha=0.4)
             num += 1
 
+    ax.invert_yaxis()  #Make row 0 at the top
+    return fig, ax
+
+def _get_board():
+    """
+    Return the cached board, building it on first use. plt.show() closes the figure on some backends
+    (e.g. Jupyter inline, or when the window is closed), and a closed figure can't be shown again, so
+    in that case a fresh board is built.
+
+    Returns:
+        tuple: (fig, ax) of the cached board.
+    """
+    import matplotlib.pyplot as plt
+
+    fig = _BOARD.get('fig')
+    if fig is None or not plt.fignum_exists(fig.number):
+        _BOARD['fig'], _BOARD['ax'] = _build_board()
+        _BOARD['star'] = None
+    return _BOARD['fig'], _BOARD['ax']
+
+def _draw_star_on_board(star_position, page_num):
+    fig, ax = _get_board()
+
+    #Remove the star from the previous call
+    if _BOARD['star'] is not None:
+        _BOARD['star'].remove()
+
     #Draw star for the given position 1-9
     row, col = num_to_position(star_position)
-    ax.scatter(col, row, marker='*', s=800, color='gold', edgecolors='black')
+    _BOARD['star'] = ax.scatter(col, row, marker='*', s=800, color='gold', edgecolors='black')
+
+    ax.set_title("Page Number:{}".format(page_num))
+    return fig
+
+def show_board_with_star(star_position, page_num):
+    """
+    Display a 3x3 board with a single yellow star at the given position.
+    Each cell also shows its position number faintly for reference.
+    The board itself is cached, so only the star and the title are redrawn per call.
+
+    Args:
+        star_position (int): The board position (1–9) where the star should appear.
+        page_num (int): The page number the card should be in, for reference.
+    """
+    import matplotlib.pyplot as plt
 
-    plt.gca().invert_yaxis()  #Make row 0 at the top
-    plt.title("Page Number:{}".format(page_num))
+    fig = _draw_star_on_board(star_position, page_num)
+    fig.canvas.draw_idle()
     plt.show()
 
+def render_board_png(star_position, page_num, out=None):
+    """
+    Render the same board as show_board_with_star to a PNG instead of displaying it, e.g. to export the
+    positions of many cards. Nothing is shown and the cached board stays open, so repeated calls only
+    redraw the star. Set the environment variable MPL_BACKEND=Agg to skip the GUI entirely.
+
+    Args:
+        star_position (int): The board position (1–9) where the star should appear.
+        page_num (int): The page number the card should be in, for reference.
+        out (str or file-like): Where to save the PNG. If None, the PNG is returned as bytes.
+
+    Returns:
+        bytes or None: The PNG data if out is None, otherwise None (saves the PNG to out).
+    """
+    fig = _draw_star_on_board(star_position, page_num)
+    target = io.BytesIO() if out is None else out
+    fig.savefig(target, format='png', dpi=100, bbox_inches='tight')
+    return target.getvalue() if out is None else None
+
 def plot_page_pos(poke_national_dex_num):
     #Since a standard page is 3x3, 9 cards are on one page
-    #We use the symbols instead of divmod since theses are "small" numbers.
-    quotient_page = poke_national_dex_num // 9
-    remainder_ind = poke_national_dex_num % 9
-    
-    #For numbers not divisble by 9, we need to add one to the quotient for the accurate page.
-    #For numbers divisible by 9, the quoitient is the right page but now the individual position (remainder) is wrong. It should be 9.
-    if remainder_ind == 0:
-        remainder_ind = 9
-    else:
-        quotient_page += 1
+    #Counting from 0 (dex num - 1) makes a single divmod give the page and position directly, with no special case
+    #for numbers divisible by 9: #10 -> (1, 0) -> page 2, position 1 and #18 -> (1, 8) -> page 2, position 9
+    #int() because nat_dex_num reads as float (e.g. 83.0) when a record has a blank cell, and the position indexes a tuple
+    quotient_page, remainder_ind = divmod(int(poke_national_dex_num) - 1, 9)
+
+    show_board_with_star(remainder_ind + 1, quotient_page + 1)
+
+def batch_positions(nums):
+    """
+    Vectorized version of the page/position arithmetic in plot_page_pos, for many dex numbers at once.
+
+    Args:
+        nums (array-like of int): The National Dex numbers.
+
+    Returns:
+        tuple:
+            - pages (np.ndarray): The page number of each card.
+            - positions (np.ndarray): The position (1-9) of each card on its page.
+    """
+    pages, positions = np.divmod(np.asarray(nums, dtype=np.int64) - 1, 9)
+    return pages + 1, positions + 1
+
+def show_board_pages(nums):
+    """
+    Display one 3x3 board per page that holds any of the given cards, with a star at each of their positions.
+    Useful to see a whole binder at once, e.g. show_board_pages(record_df['nat_dex_num']).
+
+    Args:
+        nums (array-like of int): The National Dex numbers of the cards.
+    """
+    import matplotlib.pyplot as plt
 
-    show_board_with_star(remainder_ind, quotient_page)
+    pages, positions = batch_positions(nums)
+    rows, cols = np.divmod(positions - 1, 3)
+
+    #Draw all stars of a page with a single scatter call
+    unique_pages, page_ids = np.unique(pages, return_inverse=True)
+    for i, page_num in enumerate(unique_pages):
+        on_page = page_ids == i
+        fig, ax = _build_board()
+        ax.scatter(cols[on_page], rows[on_page], marker='*', s=800, color='gold', edgecolors='black')
+        ax.set_title("Page Number:{}".format(page_num))
+        plt.show()
 
 def add_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
     """
@@ -106,7 +431,7 @@ def add_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
         national_dex_num (pd.int): The National Dex number of the Pokemon being added.
         name_of_pokemon (str): The name of the Pokemon.
         record_df (pd.DataFrame: The df of your record of cards.
-        csv_name (str): The filename of the CSV file to update (including '.csv').
+        csv_name (str): The filename of the record to update (including '.csv' or '.feather').
 
     Returns:
         pd.DataFrame: The updated DataFrame, with a new card added.
@@ -118,8 +443,9 @@ def add_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
                'foil_flag': clean_foil_check, 'full_art_flag': clean_full_art_check, 'url': clean_url_input}
     
     # Append the row (returns a new DataFrame)
-    record_df.loc[len(record_df)] = new_row
-    record_df.to_csv(csv_name, index=False) #resave new dataframe
+    record_df = append_record_rows(record_df, [new_row])
+    #Only the new card is written (appended to the end of csv records), not the whole record
+    append_to_record_file([new_row], csv_name)
 
     #Now physically add it to your binder based on numerical order
     print('Add it to your binder now according to our predicted position and page number:')
@@ -127,12 +453,39 @@ def add_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
 
     return record_df
 
-def replace_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
+def add_cards_bulk(rows, record_df, csv_name):
+    """
+    Adds several cards to the DataFrame at once and saves the record a single time, instead of once per card.
+    For csv records only the new cards are written (appended to the end of the file).
+
+    Args:
+        rows (list of dict): The cards to add, one dict per card with the record columns as keys
+                             ('nat_dex_num', 'pokemon_name', 'set_name', 'foil_flag', 'full_art_flag', 'url').
+        record_df (pd.DataFrame): The df of your record of cards.
+        csv_name (str): The filename of the record to update (including '.csv' or '.feather').
+
+    Returns:
+        pd.DataFrame: The updated DataFrame, with the new cards added.
+    """
+    record_df = append_record_rows(record_df, rows)
+    if csv_name.endswith('.feather'):
+        save_record(record_df, csv_name) #feather can't be appended to, so save the whole record once
+    else:
+        append_to_record_file(rows, csv_name) #write only the new cards
+    return record_df
+
+def replace_card_record(national_dex_num, name_of_pokemon, record_df, csv_name, record_index=None):
+    #Find the row once (record_index maps pokemon_name -> row position) instead of re-scanning the column per field
+    if record_index is None:
+        record_index = build_record_index(record_df, 'pokemon_name')
+    row_pos = record_index[name_of_pokemon]
+    
     #Get info of the row in the records_df
-    set_name_info = record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'set_name'].values[0]
-    foil_flag_info = record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'foil_flag'].values[0]
-    full_art_flag_info = record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'full_art_flag'].values[0]
-    url_info = record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'url'].values[0]
+    card_row = record_df.iloc[row_pos]
+    set_name_info = card_row['set_name']
+    foil_flag_info = card_row['foil_flag']
+    full_art_flag_info = card_row['full_art_flag']
+    url_info = card_row['url']
 
     # Display results
     print("{} #{} is currently in your collection. It has the following details: ".format(name_of_pokemon, national_dex_num))
@@ -146,18 +499,17 @@ def replace_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
 
     replace_check = input("Would you like to replace your card?: ")
     clean_replace_check = replace_check.strip()
-    acceptable_yes_arr = ["y", "yes", "Yes", 'yup']
 
-    if clean_replace_check in acceptable_yes_arr:
+    if clean_replace_check.casefold() in _YES:
         clean_set_name_input, clean_foil_check, clean_full_art_check, clean_url_input = ask_card_details()
         
-        #Update df
-        record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'set_name'] = clean_set_name_input
-        record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'foil_flag'] = clean_foil_check
-        record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'full_art_flag'] = clean_full_art_check
-        record_df.loc[(record_df['pokemon_name'] == name_of_pokemon), 'url'] = clean_url_input
+        #Update df in place at the row we already found
+        new_details = {'set_name': clean_set_name_input, 'foil_flag': clean_foil_check,
+                       'full_art_flag': clean_full_art_check, 'url': clean_url_input}
+        for col, value in new_details.items():
+            set_record_value(record_df, row_pos, col, value)
         
-        record_df.to_csv(csv_name, index=False) #resave new dataframe
+        save_record(record_df, csv_name) #resave new dataframe
 
         #Now physically add it to your binder based on numerical order
         print('Add it to your binder now according to our predicted position and page number:')
@@ -168,28 +520,30 @@ def replace_card_record(national_dex_num, name_of_pokemon, record_df, csv_name):
     return record_df
 
 def card_recording(record_csv_name):
-    init_poke_record_df = pd.read_csv(record_csv_name)
+    init_poke_record_df = load_record(record_csv_name)
 
-    national_dex_df = pd.read_csv('pokemon_dex_num.csv')
+    dex_by_name, dex_by_num = load_dex()
     user_poke_name_check = input("Enter the name of the Pokemon: ")
     
-    #First calpitalize the words. Then, clean the result of leading and trailing whitespace of user input
-    cap_name_check = user_poke_name_check.title()
-    poke_name_check = cap_name_check.strip()
+    #Clean leading and trailing whitespace, then match the name ignoring case
+    #(.title() used to turn names like "Farfetch'd" into "Farfetch'D" so they were never found)
+    dex_match = dex_by_name.get(user_poke_name_check.strip().casefold())
     
     #Check if the name of the pokemon is in the National Dex
-    if (national_dex_df['NAME'] == poke_name_check).any():
+    if dex_match is not None:
         print('Pokemon does exist in the National Dex. Taking the National Dex Number.')
         
-        #The following line will always take the first instance (values[0]),
+        #The lookup always holds the first instance of the name,
         #which really doesn't matter for this since we ignore special variants
-        dex_num = national_dex_df.loc[(national_dex_df['NAME'] == poke_name_check), 'national_dex_num'].values[0]
+        #The name is recorded as it is spelled in the National Dex
+        poke_name_check, dex_num = dex_match
         print('National Dex number is #{}'.format(dex_num))
         print('----------------------------------------------------------------------- \n')
     
         #Check if card is already documented
         #Either you add it for the first time, or you can replace it
-        existence_check = (init_poke_record_df['pokemon_name'] == poke_name_check).any()
+        record_index = build_record_index(init_poke_record_df, 'pokemon_name')
+        existence_check = poke_name_check in record_index
         if existence_check == 0:
             print('Pokemon does not exists in your records. Going into add_card_record function: ')
             poke_record_df = add_card_record(dex_num, poke_name_check, init_poke_record_df, record_csv_name)
@@ -198,7 +552,7 @@ def card_recording(record_csv_name):
             
         elif existence_check == 1:
             print('Pokemon does exist in your records! Going into replace_card_record function: ')
-            poke_record_df = replace_card_record(dex_num, poke_name_check, init_poke_record_df, record_csv_name)
+            poke_record_df = replace_card_record(dex_num, poke_name_check, init_poke_record_df, record_csv_name, record_index)
             
             return poke_record_df
     else:
@@ -207,7 +561,7 @@ def card_recording(record_csv_name):
         return init_poke_record_df
 
 def check_existence_in_record(record_csv_name):
-    poke_record_df = pd.read_csv(record_csv_name)
+    poke_record_df = load_record(record_csv_name)
     name_or_dex_num = input("Enter the Pokemon name or National Dex Number: ")
     clean_name_or_dex_num = name_or_dex_num.strip()
     
@@ -220,66 +574,66 @@ def check_existence_in_record(record_csv_name):
         if dex_num_match.empty:
             print(f"No card found with National Dex Number {dex_num_to_find}.")
         else:
-            #Give url for easy reference
-            url_info = poke_record_df.loc[(poke_record_df['nat_dex_num'] == dex_num_to_find), 'url'].values[0]
+            #Give url for easy reference (reusing the matched rows rather than filtering again)
+            url_info = dex_num_match['url'].iat[0]
             print('Card exists in your records! Giving position in binder now: ')
             print(f"Pokemon Card URL: {url_info}")
             plot_page_pos(dex_num_to_find)
             
     except ValueError:
-        #Treat input as a card name
-        card_name_match = poke_record_df[poke_record_df['pokemon_name'] == clean_name_or_dex_num]
+        #Treat input as a card name, matched ignoring case against the record itself, so no National Dex csv file
+        #is needed (astype(object) lets .str work even if every name in the record is blank)
+        record_names = poke_record_df['pokemon_name'].astype(object).str.casefold()
+        card_name_match = poke_record_df[record_names == clean_name_or_dex_num.casefold()]
 
         if card_name_match.empty:
             print(f"No card found with name {clean_name_or_dex_num} found.")
         else:
-            dex_num_info = poke_record_df.loc[(poke_record_df['pokemon_name'] == clean_name_or_dex_num), 'nat_dex_num'].values[0]
-            url_info = poke_record_df.loc[(poke_record_df['pokemon_name'] == clean_name_or_dex_num), 'url'].values[0]
+            #Reuse the matched rows rather than filtering again
+            dex_num_info = card_name_match['nat_dex_num'].iat[0]
+            url_info = card_name_match['url'].iat[0]
             print('Card exists in your records! Giving position in binder now: ')
             print(f"Pokemon Card URL: {url_info}")
             plot_page_pos(dex_num_info)
     return None
 
 def find_dex_num_or_pokemon_name():
-    national_dex_df = pd.read_csv('pokemon_dex_num.csv') #Read in csv of national dex numbers for pokemon
+    dex_by_name, dex_by_num = load_dex() #Lookups built from the csv of national dex numbers for pokemon
     
     nat_dex_num_or_name = input("Enter the Pokemon name or National Dex Number to find it in the national dex: ")
     clean_name_or_dex_num = nat_dex_num_or_name.strip() #clean name from any superfluous spaces
     
     #Try to interpret the input as an integer first
     try:
-        dex_num_to_find = np.int64(clean_name_or_dex_num) #make it the same type as in the csv file
-        #Find any matches
-        poke_name_match = national_dex_df.loc[(national_dex_df['national_dex_num'] == dex_num_to_find), 'NAME']
+        dex_num_to_find = int(clean_name_or_dex_num)
+        #Find the first match
+        first_poke_name_match = dex_by_num.get(dex_num_to_find)
         
-        if poke_name_match.empty:
+        if first_poke_name_match is None:
             print(f"No Pokemon found with National Dex Number {dex_num_to_find}.")
         else:
-            first_poke_name_match = national_dex_df.loc[(national_dex_df['national_dex_num'] == dex_num_to_find), 'NAME'].values[0]
             print('\nVia dex num. match: {} has the national dex number #{}'.format(first_poke_name_match, dex_num_to_find))
             
     except ValueError:
-        #Treat input as a Pokemon name
-        dex_num_match =  national_dex_df.loc[(national_dex_df['NAME'] == clean_name_or_dex_num), 'national_dex_num']
+        #Treat input as a Pokemon name (any capitalization)
+        dex_match = dex_by_name.get(clean_name_or_dex_num.casefold())
         
-        if dex_num_match.empty:
+        if dex_match is None:
             print(f"{clean_name_or_dex_num} doesn't seem to have a National Dex Number. Double check spelling or csv file.")
         else:
-            first_dex_num_match =  national_dex_df.loc[(national_dex_df['NAME'] == clean_name_or_dex_num), 'national_dex_num'].values[0]
-            print('\nVia name match: {} has the national dex number #{}'.format(clean_name_or_dex_num, first_dex_num_match))
+            poke_name, first_dex_num_match = dex_match
+            print('\nVia name match: {} has the national dex number #{}'.format(poke_name, first_dex_num_match))
     return None
 
 def ask_card_details():
     
     print('Please provide additional info to replace card:\n')
     stripped_set_name_input = get_list_of_poke_sets()
-    foil_check = input("Is this card a foil? (Any foil): ") #valid responses are yes, Yes, y, yup
+    foil_check = input("Is this card a foil? (Any foil): ") #valid responses are y, yes, yup, yeah, yep (any capitalization)
     stripped_foil_check = foil_check.strip()
 
     #If a card is not foil, no point in asking next question, just autofill
-    acceptable_yes_arr_2 = ["y", "Y", "yes", "Yes", 'yup']
-
-    if stripped_foil_check in acceptable_yes_arr_2:
+    if stripped_foil_check.casefold() in _YES:
         stripped_foil_check = 'yes'
         full_art_check = input("Is this card full art? (IR or higher rarity): ") #valid responses are yes, Yes, y
         stripped_full_art_check = full_art_check.strip()
@@ -291,6 +645,32 @@ def ask_card_details():
 
     return stripped_set_name_input, stripped_foil_check, stripped_full_art_check, stripped_url_input
 
+#Recent Scarlet & Violet-era sets to Mega Evolution
+RECENT_SETS = (
+    "Ascended Heroes",
+    "Phantasmal Flames",
+    "Mega Evolution",
+    "White Flare",
+    "Black Bolt",
+    "Destined Rivals",
+    "Journey Together",
+    "Prismatic Evolutions",
+    "Surging Sparks",
+    "Stellar Crown",
+    "Shrouded Fable",
+    "Twilight Masquerade",
+    "Temporal Forces",
+    "Paldean Fates",
+    "Paradox Rift",
+    "151"
+)
+
+#The numbered menu and the number -> set lookup only depend on RECENT_SETS, so build them once at import
+#The last option is 'Other' for manual input
+_SETS_PROMPT = "Select the set name:\n" + "\n".join(f"{i}. {name}" for i, name in enumerate(RECENT_SETS, 1)) \
+               + f"\n{len(RECENT_SETS) + 1}. Other"
+_SETS_BY_NUMBER = {str(i): name for i, name in enumerate(RECENT_SETS, 1)}
+
 def get_list_of_poke_sets():
     """
     Prompt the user to select a recent Pokémon TCG set name.
@@ -307,35 +687,10 @@ def get_list_of_poke_sets():
     Returns:
         str: The selected or manually entered set name (stripped of leading/trailing spaces).
     """
-    #Recent Scarlet & Violet-era sets to Mega Evolution
-    recent_sets = [
-        "Ascended Heroes",
-        "Phantasmal Flames",
-        "Mega Evolution",
-        "White Flare",
-        "Black Bolt",
-        "Destined Rivals",
-        "Journey Together",
-        "Prismatic Evolutions",
-        "Surging Sparks",
-        "Stellar Crown",
-        "Shrouded Fable",
-        "Twilight Masquerade",
-        "Temporal Forces",
-        "Paldean Fates",
-        "Paradox Rift",
-        "151"
-    ]
-
-    #Print set names and enumerate them
-    print("Select the set name:")
-    for i, name in enumerate(recent_sets, 1):
-        print(f"{i}. {name}")
-    print(f"{len(recent_sets) + 1}. Other") #Have an 'Other' option for manual input
+    #Print the prebuilt menu of set names
+    print(_SETS_PROMPT)
 
     choice = input("Enter number: ").strip() #Have the user enter just the number
 
-    if choice.isdigit() and 1 <= int(choice) <= len(recent_sets):
-        return recent_sets[int(choice) - 1]
-    else:
-        return input("Enter the set name of the card: ").strip()
\ No newline at end of file
+    #Anything that isn't one of the listed numbers (including 'Other') falls back to manual input
+    return _SETS_BY_NUMBER.get(choice) or input("Enter the set name of the card: ").strip()
\ No newline at end of file
@@ -1,11 +1,111 @@
+import atexit
+import functools
+import os
 import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+#lxml parses pages in C and the two fields we need are read with precompiled XPath queries.
+#If lxml isn't installed, pages are parsed with BeautifulSoup's built-in parser instead.
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+else:
+    _H1_XPATH = etree.XPath('//h1')
+    #The table cell whose text is the label, e.g. _LABEL_TD_XPATH(page, label='Ungraded')
+    _LABEL_TD_XPATH = etree.XPath('//td[normalize-space()=$label]')
+
+#Only the <h1> title and the price table cells are ever read, so BeautifulSoup skips building the rest of the page
+PAGE_STRAINER = SoupStrainer(['h1', 'td'])
+
+#Characters stripped from a scraped price ('$1,234.50' -> '1234.50') in one str.translate pass
+_MONEY_CHARS = str.maketrans('', '', '$, \t\r\n')
+
+#Column types of a card file. Giving them to the reader skips type inference, and the smaller types
+#(a two-value category for grade_yn, Int32 quantity) use less memory than the defaults.
+#Prices stay float64: in float32 a price like 1234.56 shows up as 1234.560059.
+#Text columns keep pandas' default so a missing name stays NaN (the 'string' dtype's pd.NA breaks row masks)
+GRADE_DTYPE = pd.CategoricalDtype(['No', 'Yes'])
+CARD_DTYPES = {'ungraded_price': 'float64', 'PSA10_price': 'float64', 'grade_yn': GRADE_DTYPE, 'quantity': 'Int32'}
+
+#Card files with changes that haven't been written to disk yet, keyed by filename (see defer_save_poke_df)
+_PENDING_SAVES = {}
+
+#Parquet files are zstd-compressed: several times smaller than csv and still fast to decompress
+PARQUET_COMPRESSION = 'zstd'
+
+#Number of card pages multi_update_poke_df scrapes at the same time
+MAX_CONCURRENT_SCRAPES = 4
+
+#Seconds to wait for PriceCharting to respond before giving up on a page
+REQUEST_TIMEOUT = 10
+
+#How long (seconds) a downloaded page is reused before it is fetched again, when requests_cache is installed
+CACHE_EXPIRE_SECONDS = 3600
+
+#Folder of the requests_cache database, in your user cache directory rather than the notebook's working directory
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'pokemon_tcg')
+
+#One shared session keeps connections to PriceCharting open between requests (no new TCP/TLS handshake per card).
+#It is created on first use (see _get_session), so importing this file doesn't create any files.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    #The lock keeps concurrent scrapes from each creating their own session
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _new_session()
+    return _SESSION
+
+def _new_session():
+    #With requests_cache installed, pages are also cached on disk so re-running an update within the hour
+    #reads them locally instead of going back to the site
+    try:
+        import requests_cache
+    except ImportError:
+        session = requests.Session()
+    else:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        session = requests_cache.CachedSession(os.path.join(CACHE_DIR, 'pricecharting_cache'),
+                                               expire_after=CACHE_EXPIRE_SECONDS, cache_control=True)
+    #Header might change based on browser
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    #Ask for every compression urllib3 can decode here, which includes Brotli ('br', smaller than gzip for html)
+    #once the brotli package is installed
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16))
+    return session
+
+def _get_page(url, fresh=False):
+    """
+    Downloads a PriceCharting page through the shared session.
+
+    Args:
+        url (str): The URL of the PriceCharting page for a specific Pokémon card.
+        fresh (bool): Always download the page from the site, even if requests_cache has a copy
+                      less than CACHE_EXPIRE_SECONDS old (default False).
+
+    Returns:
+        requests.Response: The response for the page.
+    """
+    session = _get_session()
+    #The timeout keeps one stalled connection from hanging a whole multi_update_poke_df
+    if fresh and hasattr(session, 'cache'):
+        return session.get(url, timeout=REQUEST_TIMEOUT, force_refresh=True)
+    return session.get(url, timeout=REQUEST_TIMEOUT)
 
-def new_pokemon_df(name_of_csv):
+def new_pokemon_df(name_of_csv, file_format='csv'):
     """
     Creates a new CSV file with the specified name containing an empty Pokémon card DataFrame 
     with the following columns: 'Card_Name', 'Set_Name', 'url', 'ungraded_price', 'PSA10_price', 'grade_yn', 'quantity'
@@ -13,21 +113,257 @@ def new_pokemon_df(name_of_csv):
 
     Args:
         name_of_csv (str): The base name (without .csv extension) to use for the new CSV file.
+        file_format (str): 'csv' (default), 'parquet' or 'feather'. Parquet and Feather files are smaller and
+                           much faster to read and save but are not human-readable, use export_poke_csv to get a csv copy.
 
     Returns:
         None (saves a csv file to your computer)
     """
     poke_df = pd.DataFrame(columns = ['Card_Name', 'Set_Name', 'url', 'ungraded_price', 'PSA10_price', 'grade_yn', 'quantity'])
-    poke_df.to_csv('{}.csv'.format(name_of_csv), index=False)
+    save_poke_df(poke_df, '{}.{}'.format(name_of_csv, file_format))
+    return None
+
+@functools.lru_cache(maxsize=8)
+def _load_poke_df_cached(poke_csv_name, mtime, size):
+    #mtime and size are only part of the cache key, so a changed file is read again
+    if poke_csv_name.endswith('.parquet'):
+        return apply_card_dtypes(pd.read_parquet(poke_csv_name))
+    if poke_csv_name.endswith('.feather'):
+        return apply_card_dtypes(pd.read_feather(poke_csv_name))
+    return pd.read_csv(poke_csv_name, dtype=CARD_DTYPES)
+
+def apply_card_dtypes(df_poke_cards):
+    """
+    Casts the columns of a card DataFrame to CARD_DTYPES (columns that aren't present are skipped).
+
+    Args:
+        df_poke_cards (pd.DataFrame): The DataFrame containing Pokémon card data.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the card column types.
+    """
+    return df_poke_cards.astype({col: dtype for col, dtype in CARD_DTYPES.items() if col in df_poke_cards.columns})
+
+def load_poke_df(poke_csv_name):
+    """
+    Reads your Pokémon card file. Files ending in '.parquet' or '.feather' are read with pyarrow,
+    anything else is read as csv. The parsed file is reused until the file changes on disk (its
+    modification time or size), so calling several card functions in a row only reads it once.
+    Changes still waiting to be saved (see defer_save_poke_df) are returned instead of the file on disk.
+
+    Args:
+        poke_csv_name (str): The filename of the card file (including '.csv', '.parquet' or '.feather').
+
+    Returns:
+        pd.DataFrame: A copy of the df of your Pokémon cards (safe to modify).
+    """
+    #Changes that haven't been written yet are newer than the file on disk
+    if poke_csv_name in _PENDING_SAVES:
+        return _PENDING_SAVES[poke_csv_name].copy()
+    file_stat = os.stat(poke_csv_name)
+    return _load_poke_df_cached(poke_csv_name, file_stat.st_mtime_ns, file_stat.st_size).copy()
+
+def save_poke_df(df_poke_cards, poke_csv_name):
+    """
+    Saves your Pokémon card file in the format given by its extension ('.parquet', '.feather' or csv).
+    Parquet and Feather are binary columnar formats that save much faster than csv for large collections.
+    The file is written to a temporary file first and then swapped in, so an interrupted save
+    never leaves a half-written file behind.
+
+    Args:
+        df_poke_cards (pd.DataFrame): The DataFrame containing Pokémon card data.
+        poke_csv_name (str): The filename of the card file (including '.csv', '.parquet' or '.feather').
+
+    Returns:
+        None (saves the file to your computer)
+    """
+    tmp_name = poke_csv_name + '.tmp'
+    if poke_csv_name.endswith('.parquet'):
+        df_poke_cards.to_parquet(tmp_name, index=False, compression=PARQUET_COMPRESSION, compression_level=3)
+    elif poke_csv_name.endswith('.feather'):
+        df_poke_cards.reset_index(drop=True).to_feather(tmp_name) #feather only supports the default index
+    else:
+        df_poke_cards.to_csv(tmp_name, index=False)
+    os.replace(tmp_name, poke_csv_name)
+    #This save already includes any changes that were waiting to be written
+    _PENDING_SAVES.pop(poke_csv_name, None)
+    return None
+
+def defer_save_poke_df(df_poke_cards, poke_csv_name):
+    """
+    Marks your Pokémon card file as changed without writing it yet. The latest DataFrame for each file
+    is written once, when flush_pending_saves is called or when Python exits, so a session of several
+    adds/updates saves the file once instead of after every change. The card functions read pending
+    changes back through load_poke_df, so they always see the latest cards.
+    Pending changes are lost if the kernel is killed, and the save replaces the whole file, so edits made to
+    it in another program in the meantime are overwritten. Call flush_pending_saves first in both cases.
+
+    Args:
+        df_poke_cards (pd.DataFrame): The DataFrame containing Pokémon card data.
+        poke_csv_name (str): The filename of the card file (including '.csv', '.parquet' or '.feather').
+
+    Returns:
+        None
+    """
+    _PENDING_SAVES[poke_csv_name] = df_poke_cards.copy()
+    return None
+
+def flush_pending_saves(poke_csv_name=None):
+    """
+    Writes card files with changes that are waiting to be saved (see defer_save_poke_df).
+    This runs automatically when Python exits; call it yourself before opening the file in
+    another program or if you're about to shut down the notebook kernel.
+
+    Args:
+        poke_csv_name (str): Only save this file. By default every file with pending changes is saved.
+
+    Returns:
+        None (saves the files to your computer)
+    """
+    names = [poke_csv_name] if poke_csv_name is not None else list(_PENDING_SAVES)
+    for name in names:
+        if name in _PENDING_SAVES:
+            save_poke_df(_PENDING_SAVES[name], name)
     return None
 
-def extract_price(url, label):
+atexit.register(flush_pending_saves)
+
+def export_poke_csv(poke_csv_name):
+    """
+    Exports a Parquet or Feather card file to a human-readable csv file with the same base name, e.g. as a backup
+    or to open it in a spreadsheet.
+
+    Args:
+        poke_csv_name (str): The filename of your card file (including '.parquet' or '.feather').
+
+    Returns:
+        str: The filename of the exported csv file.
+    """
+    csv_name = os.path.splitext(poke_csv_name)[0] + '.csv'
+    load_poke_df(poke_csv_name).to_csv(csv_name, index=False)
+    return csv_name
+
+def append_poke_rows(df_poke_cards, rows, poke_csv_name):
     """
-    Scrapes the given URL to extract the price corresponding to a specified label 
-    (e.g., 'PSA 10', 'Ungraded') from a PriceCharting page.
+    Appends new cards to the DataFrame with a single pd.concat and writes them to the end of the file.
+    csv files are opened in append mode so only the new rows are written, instead of rewriting every
+    card already saved. Parquet and Feather files can't be appended to, so those (and files with unsaved
+    changes) are saved in full later, see defer_save_poke_df.
+
+    Args:
+        df_poke_cards (pd.DataFrame): The existing DataFrame containing Pokémon card data.
+        rows (list of dict): The cards to add, keyed by column name.
+        poke_csv_name (str): The filename of the card file (including '.csv', '.parquet' or '.feather').
+
+    Returns:
+        pd.DataFrame: A new DataFrame with the cards appended.
+    """
+    new_rows_df = apply_card_dtypes(pd.DataFrame(rows, columns=df_poke_cards.columns))
+    if df_poke_cards.empty:
+        #A freshly created file reads back with untyped (object) columns, so start from the new rows' dtypes instead
+        df_poke_cards = new_rows_df
+    else:
+        df_poke_cards = pd.concat([df_poke_cards, new_rows_df], ignore_index=True)
+    #Binary files can't be appended to, and a file with unsaved changes would lose them to the append,
+    #so in both cases the whole DataFrame is saved later instead
+    if poke_csv_name.endswith(('.parquet', '.feather')) or poke_csv_name in _PENDING_SAVES:
+        defer_save_poke_df(df_poke_cards, poke_csv_name)
+        return df_poke_cards
+
+    #If the file was edited by hand and lost its final newline, the first new row would join the last line
+    with open(poke_csv_name, 'rb+') as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+    new_rows_df.to_csv(poke_csv_name, mode='a', header=False, index=False)
+    return df_poke_cards
+
+def fetch_soup(url, fresh=False):
+    """
+    Downloads a PriceCharting page once and parses it, so the card name, set name and every
+    price can be read from the same response.
 
     Args:
         url (str): The URL of the PriceCharting page for a specific Pokémon card.
+        fresh (bool): Skip requests_cache and download the current page (default False, see _get_page).
+
+    Returns:
+        lxml.html.HtmlElement or BeautifulSoup: The parsed page (see parse_page).
+    """
+    return parse_page(_get_page(url, fresh=fresh))
+
+def parse_page(response):
+    """
+    Parses a downloaded PriceCharting page with lxml, or with BeautifulSoup (keeping only its
+    <h1> and <td> tags) if lxml isn't installed.
+
+    Args:
+        response (requests.Response): The response for a PriceCharting page.
+
+    Returns:
+        lxml.html.HtmlElement or BeautifulSoup: The parsed page.
+    """
+    if lxml_html is not None:
+        return lxml_html.document_fromstring(response.content.decode('utf-8', errors='replace'))
+    return BeautifulSoup(response.content, 'html.parser', parse_only=PAGE_STRAINER, from_encoding='utf-8')
+
+def extract_prices(page, labels=('Ungraded', 'PSA 10')):
+    """
+    Extracts the prices for several labels (e.g., 'PSA 10', 'Ungraded') from a parsed PriceCharting page.
+    With lxml each label's cell is found by a precompiled XPath query, otherwise by one pass over the table cells.
+
+    Args:
+        page (lxml.html.HtmlElement or BeautifulSoup): The parsed page returned by fetch_soup.
+        labels (tuple of str): The text labels used to identify the desired price rows 
+                               (default ('Ungraded', 'PSA 10')).
+
+    Returns:
+        dict: Maps each label to its price as a float, or np.nan if the label or price is not found
+              or conversion to float fails.
+    """
+    #Find the price cell right after each cell holding a label
+    price_texts = {}
+    if lxml_html is not None:
+        #The label match runs inside libxml2, so no Python code touches the cells that aren't labels
+        for label in labels:
+            for td in _LABEL_TD_XPATH(page, label=label):
+                price_td = next(td.itersiblings('td'), None)
+                if price_td is not None:
+                    price_texts[label] = price_td.text_content()
+                    break
+    else:
+        #Single pass, stopping once every label is found
+        for td in page.find_all('td'):
+            label = td.get_text(strip=True)
+            if label in labels and label not in price_texts:
+                price_td = td.find_next_sibling('td')
+                if price_td:
+                    price_texts[label] = price_td.text
+                    if len(price_texts) == len(labels):
+                        break
+
+    prices = {}
+    for label in labels:
+        if label not in price_texts:
+            print(f"Could not find {label} label.")
+            prices[label] = np.nan
+            continue
+        price_text = price_texts[label].translate(_MONEY_CHARS)
+        try:
+            prices[label] = float(price_text)
+        except ValueError:
+            print(f"Couldn't convert {label} price to float.")
+            prices[label] = np.nan
+    return prices
+
+def extract_price(page, label):
+    """
+    Extracts the price corresponding to a specified label 
+    (e.g., 'PSA 10', 'Ungraded') from a parsed PriceCharting page.
+
+    Args:
+        page (lxml.html.HtmlElement or BeautifulSoup): The parsed page returned by fetch_soup.
         label (str): The text label used to identify the desired price row 
                      (e.g., 'PSA 10', 'Ungraded').
 
@@ -35,33 +371,14 @@ def extract_price(url, label):
         float: The extracted price as a float if found and valid.
         np.nan: If the label or price is not found or conversion to float fails.
     """
-    #Header might change based on browser
-    headers = {
-        "User-Agent": "Mozilla/5.0"
-    }
-    
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    label_td = soup.find('td', string=label)
-    if label_td:
-        price_td = label_td.find_next_sibling('td')
-        if price_td:
-            price_text = price_td.text.strip().replace('$', '').replace(',', '')
-            try:
-                return float(price_text)
-            except ValueError:
-                print(f"Couldn't convert {label} price to float.")
-                return np.nan
-    else:
-        print(f"Could not find {label} label.")
-        return np.nan
+    return extract_prices(page, (label,))[label]
 
-def extract_card_name_set(url):
+def extract_card_name_set(page):
     """
-    Scrapes the given PriceCharting card URL to extract the card name and set name.
+    Extracts the card name and set name from a parsed PriceCharting card page.
 
     Args:
-        url (str): The URL of the PriceCharting page for a specific Pokémon card.
+        page (lxml.html.HtmlElement or BeautifulSoup): The parsed page returned by fetch_soup.
 
     Returns:
         tuple:
@@ -69,18 +386,15 @@ def extract_card_name_set(url):
             - set_name_only (str or np.nan): The set name the card belongs to 
                                              (e.g., "Pokemon Destined Rivals").
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0"
-    }
-    
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
     # Extract the card name — it's usually in the <h1> tag
-    card_name_tag = soup.find('h1')
-    if card_name_tag:
-        card_name_and_set = card_name_tag.text.strip()
-        
+    if lxml_html is not None:
+        h1_tags = _H1_XPATH(page)
+        card_name_and_set = h1_tags[0].text_content().strip() if h1_tags else None
+    else:
+        card_name_tag = page.find('h1')
+        card_name_and_set = card_name_tag.text.strip() if card_name_tag else None
+
+    if card_name_and_set is not None:
         # Split by newline and strip each part
         parts = [part.strip() for part in card_name_and_set.split('\n') if part.strip()]
         
@@ -107,7 +421,8 @@ def add_card(df_poke_cards, url, poke_csv_name):
         pd.DataFrame: The updated DataFrame, either with a new card added or with prices optionally updated.
     """
     # Get the card name and set name
-    check_card_name, set_name_only = extract_card_name_set(url)
+    soup = fetch_soup(url)
+    check_card_name, set_name_only = extract_card_name_set(soup)
     
     if ((df_poke_cards['Card_Name'] == check_card_name) & (df_poke_cards['Set_Name'] == set_name_only)).any():
         print(f"{check_card_name} from {set_name_only} is present in spreadsheet.")
@@ -127,8 +442,8 @@ def add_card(df_poke_cards, url, poke_csv_name):
         print(f"{check_card_name} from {set_name_only} is not present in the 'Card_Names' column. Adding card:")
         
         # Extract prices and determine if we should grade it
-        ungraded_price = extract_price(url, 'Ungraded')
-        psa10_price = extract_price(url, 'PSA 10')
+        prices = extract_prices(soup)
+        ungraded_price, psa10_price = prices['Ungraded'], prices['PSA 10']
         grade_choice = determine_psa_worth(psa10_price)
 
         #Since it's new, assume quantity is 1
@@ -145,9 +460,8 @@ def add_card(df_poke_cards, url, poke_csv_name):
         new_row = {'Card_Name': check_card_name, 'Set_Name': set_name_only, 'url': url, \
                    'ungraded_price':ungraded_price, 'PSA10_price':psa10_price, 'grade_yn':grade_choice, 'quantity': quantity_new}
         
-        # Append the row (returns a new DataFrame)
-        df_poke_cards.loc[len(df_poke_cards)] = new_row
-        df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+        # Append the row (returns a new DataFrame) and write only that row to the file
+        df_poke_cards = append_poke_rows(df_poke_cards, [new_row], poke_csv_name)
         
     return df_poke_cards
 
@@ -163,7 +477,7 @@ def remove_card(poke_csv_name):
     Returns:
         pd.DataFrame: The updated DataFrame with the specified row removed.
     """
-    df_poke_cards = pd.read_csv(poke_csv_name)
+    df_poke_cards = load_poke_df(poke_csv_name)
     user_input = input("Enter the card name or row index to delete: ").strip()
 
     #Try to interpret the input as an integer index
@@ -192,9 +506,9 @@ def remove_card(poke_csv_name):
             print(f"Dropping card '{user_input}' at index {index_to_drop}.")
             df_poke_cards = df_poke_cards.drop(index=index_to_drop).reset_index(drop=True)
 
-    # Save updated DataFrame
-    print('Saving csv file.')
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    #The change is kept with the other unsaved changes, say so rather than claiming the file was written
+    print(f"Change kept in memory. {poke_csv_name} is saved when Python exits, or run flush_pending_saves() to save it now.")
+    defer_save_poke_df(df_poke_cards, poke_csv_name) #saved once later, see flush_pending_saves
     return df_poke_cards
 
 def update_price(df_poke_cards, card_name, set_name, poke_csv_name, call_flag):
@@ -213,12 +527,17 @@ def update_price(df_poke_cards, card_name, set_name, poke_csv_name, call_flag):
     Returns:
         pd.DataFrame: The updated DataFrame with revised price and grading information for the specified card.
     """
+    #Rows for this card; built once and reused for the lookup and the update below
+    card_mask = (df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name)
+
     #Extract url
-    url = df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'url'].values[0]
+    url = df_poke_cards.loc[card_mask, 'url'].values[0]
     
     # Extract prices and determine if we should grade it
-    ungraded_price = extract_price(url, 'Ungraded')
-    psa10_price = extract_price(url, 'PSA 10')
+    #A price update you ask for always downloads the current page rather than a cached copy
+    soup = fetch_soup(url, fresh=True)
+    prices = extract_prices(soup)
+    ungraded_price, psa10_price = prices['Ungraded'], prices['PSA 10']
     grade_choice = determine_psa_worth(psa10_price)
         
     # Display results
@@ -233,11 +552,9 @@ def update_price(df_poke_cards, card_name, set_name, poke_csv_name, call_flag):
         # print('-------------')
     
     #Update df
-    df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'ungraded_price'] = ungraded_price
-    df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'PSA10_price'] = psa10_price
-    df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'grade_yn'] = grade_choice
+    df_poke_cards.loc[card_mask, ['ungraded_price', 'PSA10_price', 'grade_yn']] = [ungraded_price, psa10_price, grade_choice]
     
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    defer_save_poke_df(df_poke_cards, poke_csv_name) #saved once later, see flush_pending_saves
         
     return df_poke_cards
 
@@ -256,7 +573,8 @@ def update_quantity_cards(df_poke_cards, card_name, set_name, poke_csv_name):
         pd.DataFrame: The updated DataFrame with quantity for the specified card.
     """
     #First it prints how many you own right now. You can either update it by adding one or manually tell how many you have now.
-    quant_owned = df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'quantity'].values[0]
+    card_mask = (df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name)
+    quant_owned = df_poke_cards.loc[card_mask, 'quantity'].values[0]
     print(f"You currently have {quant_owned} of these cards.")
 
     #Next we have an input choice for quantity
@@ -265,14 +583,14 @@ def update_quantity_cards(df_poke_cards, card_name, set_name, poke_csv_name):
         quant_input = input("Not a valid choice! Choose 1 or 2!:\n").strip()
     
     if quant_input == '1':
-        df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'quantity'] = quant_owned + 1
+        df_poke_cards.loc[card_mask, 'quantity'] = quant_owned + 1
     elif quant_input == '2':
         quant_choice = input("How many of the card do you own?: ").strip()
         while not (quant_choice.isdigit()):
             quant_choice = input("Not a valid choice! Input only an integer: ").strip()
-        df_poke_cards.loc[(df_poke_cards['Card_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'quantity'] = int(quant_choice)
+        df_poke_cards.loc[card_mask, 'quantity'] = int(quant_choice)
     
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    defer_save_poke_df(df_poke_cards, poke_csv_name) #saved once later, see flush_pending_saves
         
     return df_poke_cards
 
@@ -282,14 +600,19 @@ def determine_psa_worth(price_of_card_psa10):
     current Gamestop pricing to send in a single card plus shipping cost.
 
     Args:
-        price_of_card_psa10 (float): The market price of the card in PSA 10 condition.
+        price_of_card_psa10 (float or np.ndarray): The market price of the card in PSA 10 condition,
+                                                   or an array of prices to decide for many cards at once.
 
     Returns:
         str: 'Yes' if the PSA 10 price exceeds the minimum grading threshold; otherwise, 'No'.
+        np.ndarray: An array of 'Yes'/'No' decisions if an array of prices was given.
     """
     min_price_grade = 22 * 2.2
     worth_grading_check = price_of_card_psa10 > min_price_grade
-    if worth_grading_check == True:
+    #Arrays are decided in one vectorized step
+    if np.ndim(worth_grading_check):
+        return np.where(worth_grading_check, 'Yes', 'No')
+    if worth_grading_check:
         grade_decision = 'Yes'
     else:
         grade_decision = 'No'
@@ -309,7 +632,7 @@ def update_poke_df(poke_csv_name):
                               None if the operation is aborted due to invalid input or no matching card found.
     """
     #must already have using the same name as you did in new_pokemon_df
-    cards_df = pd.read_csv(poke_csv_name)
+    cards_df = load_poke_df(poke_csv_name)
     #Strip is used to clean out empty spaces in the beginning or end of the 
     url_or_name = input("Enter URL or Card Name - ").strip() #asks what the user input is to determine next function
 
@@ -318,13 +641,15 @@ def update_poke_df(poke_csv_name):
         print('Entering add_card function: \n')
         df_poke_cards = add_card(cards_df, url_or_name, poke_csv_name)
     else:
-        if url_or_name in cards_df['Card_Name'].values:
+        #One vectorized compare answers both "is it there?" and "how many times?", and is reused below
+        name_mask = cards_df['Card_Name'] == url_or_name
+        count = int(name_mask.sum())
+        if count > 0:
             print(f"{url_or_name} is present in the 'Card_Names' column.")
-            count = cards_df['Card_Name'].value_counts()[url_or_name]
             if count > 1:
                 print(f"Multiple instances of {url_or_name} are present in the 'Card_Names' column. \n")
                 set_name_of_card = input("Please input set name -")
-                if ((cards_df['Card_Name'] == url_or_name) & (cards_df['Set_Name'] == set_name_of_card)).any():
+                if (name_mask & (cards_df['Set_Name'] == set_name_of_card)).any():
                     print('Entering update_price function: \n')
                     df_poke_cards = update_price(cards_df, url_or_name, set_name_of_card, poke_csv_name, call_flag = 1)
                 else:
@@ -332,7 +657,7 @@ def update_poke_df(poke_csv_name):
                     return cards_df
             else:
                 #Extract set name since card only appears once
-                set_name_of_card = cards_df.loc[(cards_df['Card_Name'] == url_or_name), 'Set_Name'].values[0]
+                set_name_of_card = cards_df.loc[name_mask, 'Set_Name'].values[0]
                 print('Entering update_price function (only one instance of card found): \n')
                 df_poke_cards = update_price(cards_df, url_or_name, set_name_of_card, poke_csv_name, call_flag = 1)
         else:
@@ -340,14 +665,92 @@ def update_poke_df(poke_csv_name):
             return cards_df
     return df_poke_cards
 
-def multi_update_poke_df(poke_csv_name):
-    #must already have using the same name as you did in new_pokemon_df
-    cards_df = pd.read_csv(poke_csv_name)
+def fetch_card_prices(url):
+    """
+    Scrapes the Ungraded and PSA 10 prices for a card from a single download of its page.
+
+    Args:
+        url (str): The URL of the PriceCharting page for a specific Pokémon card.
+
+    Returns:
+        tuple: (ungraded_price, psa10_price) as floats or np.nan.
+    """
+    soup = fetch_soup(url)
+    prices = extract_prices(soup)
+    return prices['Ungraded'], prices['PSA 10']
 
-    for i in range(0, len(cards_df)):
-        df_poke_cards = update_price(cards_df, cards_df['Card_Name'][i], cards_df['Set_Name'][i], poke_csv_name, call_flag = 2)
+def fetch_prices_politely(url):
+    """
+    Scrapes the Ungraded and PSA 10 prices for a card and then waits a random 2-4 seconds,
+    so each thread of multi_update_poke_df sends at most one request every 2-4 seconds. Pages served from the
+    local requests_cache never reach the site, so those skip the wait.
+
+    Args:
+        url (str): The URL of the PriceCharting page for a specific Pokémon card.
+
+    Returns:
+        tuple: (ungraded_price, psa10_price) as floats or np.nan.
+    """
+    response = _get_page(url)
+    if not getattr(response, 'from_cache', False):
         time.sleep(random.uniform(2.0, 4.0)) #add a time delay to prevent bot detection and to properly use this function
+    soup = parse_page(response)
+    prices = extract_prices(soup)
+    return prices['Ungraded'], prices['PSA 10']
 
+def multi_update_poke_df(poke_csv_name, max_workers=MAX_CONCURRENT_SCRAPES, polite_delay=True):
+    """
+    Updates the prices and grading decision of every card in the CSV file. Card pages are scraped
+    concurrently by a pool of threads and the new prices are saved together (see defer_save_poke_df).
+    If a card's page can't be downloaded, its name is printed and its old prices are kept.
+
+    Args:
+        poke_csv_name (str): The filename (including .csv extension) of the Pokémon data file to update.
+        max_workers (int): How many card pages to scrape at the same time (default MAX_CONCURRENT_SCRAPES).
+        polite_delay (bool): After each page it downloads, a thread waits a random 2-4 seconds to avoid bot
+                             detection (default True). The first max_workers pages are still requested together.
+                             Only turn this off for sites that don't rate limit.
+
+    Returns:
+        pd.DataFrame: The updated DataFrame with revised prices for every card.
+    """
+    #must already have using the same name as you did in new_pokemon_df
+    #The whole file is loaded rather than streamed row by row: the updated frame is returned for display,
+    #Parquet/Feather files can't be streamed, and the file is only written once at the end anyway
+    cards_df = load_poke_df(poke_csv_name)
+    fetch_prices = fetch_prices_politely if polite_delay else fetch_card_prices
+
+    def fetch_prices_or_error(url):
+        #One card failing (site error, timeout, bad url) shouldn't throw away the new prices of every other card,
+        #so the error is handed back instead of raised out of executor.map
+        try:
+            return fetch_prices(url)
+        except Exception as error:
+            return error
+
+    #Requests spend nearly all their time waiting on the network, so threads overlap them well.
+    #Progress is printed as each page comes back (in row order).
+    prices = []
+    old_prices = zip(cards_df['ungraded_price'], cards_df['PSA10_price'])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for card_name, url, card_old_prices, card_prices in zip(cards_df['Card_Name'], cards_df['url'], old_prices,
+                                                                executor.map(fetch_prices_or_error, cards_df['url'])):
+            print(f"Card Name: {card_name}")
+            print(f"Url: {url} \n")
+            if isinstance(card_prices, Exception):
+                print(f"Couldn't update {card_name} ({card_prices}). Keeping its old prices. \n")
+                card_prices = card_old_prices
+            prices.append(card_prices)
+
+    #Write all the scraped prices back as whole columns instead of cell by cell
+    prices = np.array(prices, dtype=float).reshape(-1, 2)
+    cards_df['ungraded_price'] = prices[:, 0]
+    cards_df['PSA10_price'] = prices[:, 1]
+    cards_df['grade_yn'] = determine_psa_worth(prices[:, 1])
+    cards_df = apply_card_dtypes(cards_df)
+
+    #One save for the whole run; the updated frame is also returned for display
+    defer_save_poke_df(cards_df, poke_csv_name) #saved once later, see flush_pending_saves
     return cards_df
 
 def user_update_price(poke_csv_name):
@@ -361,7 +764,7 @@ def user_update_price(poke_csv_name):
     Returns:
         pandas.DataFrame: The updated DataFrame after modifying the pricing.
     """
-    df_poke_cards = pd.read_csv(poke_csv_name)
+    df_poke_cards = load_poke_df(poke_csv_name)
     user_input = input("Enter row index to update quantity: ").strip()
     
     # Validate that input is an integer
@@ -376,8 +779,9 @@ def user_update_price(poke_csv_name):
         url = df_poke_cards['url'][index_update]
         
         # Extract prices and determine if we should grade it
-        ungraded_price = extract_price(url, 'Ungraded')
-        psa10_price = extract_price(url, 'PSA 10')
+        soup = fetch_soup(url, fresh=True) #always the current page, not a cached copy
+        prices = extract_prices(soup)
+        ungraded_price, psa10_price = prices['Ungraded'], prices['PSA 10']
         grade_choice = determine_psa_worth(psa10_price)
             
         # Display results
@@ -391,7 +795,7 @@ def user_update_price(poke_csv_name):
         df_poke_cards.at[index_update, 'PSA10_price'] = psa10_price
         df_poke_cards.at[index_update, 'grade_yn'] = grade_choice
         
-        df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+        defer_save_poke_df(df_poke_cards, poke_csv_name) #saved once later, see flush_pending_saves
     else:
         print(f"Index {index_to_drop} not found in DataFrame")
         
@@ -407,7 +811,7 @@ def user_update_quantity(poke_csv_name):
     Returns:
         pandas.DataFrame: The updated DataFrame after modifying the quantity.
     """
-    df_poke_cards = pd.read_csv(poke_csv_name)
+    df_poke_cards = load_poke_df(poke_csv_name)
     user_input = input("Enter row index to update quantity: ").strip()
     
     # Validate that input is an integer
@@ -432,7 +836,7 @@ def user_update_quantity(poke_csv_name):
         print(f"Index {index_to_drop} not found in DataFrame")
         return df_poke_cards
 
-    # Save updated DataFrame
-    print('Saving csv file.')
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    #The change is kept with the other unsaved changes, say so rather than claiming the file was written
+    print(f"Change kept in memory. {poke_csv_name} is saved when Python exits, or run flush_pending_saves() to save it now.")
+    defer_save_poke_df(df_poke_cards, poke_csv_name) #saved once later, see flush_pending_saves
     return df_poke_cards
\ No newline at end of file
@@ -1,11 +1,153 @@
+import csv
+import os
+import re
 import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import random
+import threading
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+#lxml parses pages in C and the fields we need are read with precompiled XPath queries, so no Python-level
+#tree is built or walked. If lxml isn't installed, pages are parsed with BeautifulSoup's built-in parser instead.
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+else:
+    _H1_XPATH = etree.XPath('//h1')
+    #The table cell whose text is the label, e.g. _LABEL_TD_XPATH(page, label='Ungraded')
+    _LABEL_TD_XPATH = etree.XPath('//td[normalize-space()=$label]')
+
+#Only the <h1> title and the price table cells are ever read, so BeautifulSoup skips building the rest of the page
+PAGE_STRAINER = SoupStrainer(['h1', 'td'])
+
+#Valid answers to the prompts: a menu choice of 1 or 2, and a whole number (quantity or row index).
+#[0-9] rather than \d or str.isdigit, which also accept digits like '²' that int() can't convert
+_CHOICE_RE = re.compile(r'[12]')
+_INT_RE = re.compile(r'[0-9]+')
+
+#Matches the '<td>Ungraded</td><td ...>$1,234.56</td>' row of the price table straight from the page bytes,
+#so updating a price doesn't need to build the whole page. Pages it doesn't match are parsed as usual.
+_UNGRADED_PRICE_RE = re.compile(rb'<td[^>]*>\s*Ungraded\s*</td>\s*<td[^>]*>\s*\$?([\d,]+\.\d{2})\s*</td>', re.I)
+
+#How many product pages multi_update_price_poke_product_df scrapes at the same time
+MAX_CONCURRENT_SCRAPES = 4
+
+#Parquet files are zstd-compressed: several times smaller than csv and still fast to decompress
+PARQUET_COMPRESSION = 'zstd'
+
+#Write buffer (bytes) for csv files: 1 MiB lets to_csv hand the OS a few large writes instead of many 8 KiB ones
+CSV_WRITE_BUFFER = 1 << 20
+
+#Column types of a product file. Giving them to the reader skips type inference, and quantity is kept
+#as a (nullable) Int32 instead of int64. Prices stay float64: booster box prices in float32 show up as 1234.560059.
+#Product and set names repeat a lot, as categories each row stores a small integer code and the
+#name == ... row masks compare those codes instead of every string. A missing name stays NaN
+#(unlike the 'string' dtype, whose pd.NA breaks row masks).
+PRODUCT_DTYPES = {'Product_Name': 'category', 'Set_Name': 'category', 'MSRP': 'float64', 'market_price': 'float64', 'quantity': 'Int32'}
+
+#Seconds to wait for PriceCharting to respond before giving up on a page
+REQUEST_TIMEOUT = 10
+
+#Minimum seconds between two requests to the same site (a random extra 0-100% is added to avoid bot detection).
+#Set to 0 to turn the spacing off for sites that don't rate limit.
+MIN_REQUEST_INTERVAL = 1.0
+
+#How long (seconds) a downloaded page is reused before it is fetched again, when requests_cache is installed
+CACHE_EXPIRE_SECONDS = 3600
+
+#Folder of the requests_cache database, in your user cache directory rather than the notebook's working directory
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'pokemon_tcg')
+
+#Earliest time.monotonic() the next request to each host may be sent (see wait_for_host)
+_NEXT_REQUEST_TIME = {}
+_NEXT_REQUEST_LOCK = threading.Lock()
+
+def wait_for_host(url):
+    """
+    Waits until the site in the URL may be requested again, so requests (including concurrent ones)
+    to the same site are spaced at least MIN_REQUEST_INTERVAL seconds apart. Only waits as long as needed:
+    the first request, or one after a long pause, goes out right away.
+
+    Args:
+        url (str): The URL about to be requested.
+
+    Returns:
+        None
+    """
+    host = urlsplit(url).netloc
+    with _NEXT_REQUEST_LOCK:
+        now = time.monotonic()
+        send_time = max(now, _NEXT_REQUEST_TIME.get(host, now))
+        _NEXT_REQUEST_TIME[host] = send_time + MIN_REQUEST_INTERVAL * random.uniform(1.0, 2.0)
+    if send_time > now:
+        time.sleep(send_time - now)
+    return None
 
-def new_pokemon_products_df(name_of_csv):
+class _RateLimitedAdapter(HTTPAdapter):
+    #Spacing happens here rather than around the session's get, so pages answered from the cache are never delayed
+    def send(self, request, **kwargs):
+        wait_for_host(request.url)
+        return super().send(request, **kwargs)
+
+#One shared session keeps connections to PriceCharting open between requests (no new TCP/TLS handshake per product).
+#It is created on first use (see _get_session), so importing this file doesn't create any files.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    #The lock keeps concurrent scrapes from each creating their own session
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _new_session()
+    return _SESSION
+
+def _new_session():
+    #With requests_cache installed, pages are also cached on disk so re-running an update within the hour
+    #reads them locally instead of going back to the site
+    try:
+        import requests_cache
+    except ImportError:
+        session = requests.Session()
+    else:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        session = requests_cache.CachedSession(os.path.join(CACHE_DIR, 'pricecharting_cache'),
+                                               expire_after=CACHE_EXPIRE_SECONDS, cache_control=True)
+    #Header might change based on browser
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    #Rate limited (429) or server error responses are retried up to 3 times with a growing pause in between.
+    #If they keep failing the last response is returned (raise_on_status=False) and fetch_product_price raises for its status.
+    session.mount('https://', _RateLimitedAdapter(pool_connections=1, pool_maxsize=32,
+                                                  max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                                                                    raise_on_status=False)))
+    return session
+
+def _get_page(url, fresh=False):
+    """
+    Downloads a PriceCharting page through the shared session.
+
+    Args:
+        url (str): The URL of the PriceCharting page for a specific Pokémon product.
+        fresh (bool): Always download the page from the site, even if requests_cache has a copy
+                      less than CACHE_EXPIRE_SECONDS old (default False).
+
+    Returns:
+        requests.Response: The response for the page.
+    """
+    session = _get_session()
+    if fresh and hasattr(session, 'cache'):
+        return session.get(url, timeout=REQUEST_TIMEOUT, force_refresh=True)
+    return session.get(url, timeout=REQUEST_TIMEOUT)
+
+def new_pokemon_products_df(name_of_csv, file_format='csv'):
     """
     Creates a new CSV file with the specified name containing an empty Pokémon card DataFrame 
     with the following columns: 'Product_Name', 'Set_Name', 'url', 'MSRP', 'market_price', 'quantity'
@@ -13,21 +155,171 @@ def new_pokemon_products_df(name_of_csv):
 
     Args:
         name_of_csv (str): The base name (without .csv extension) to use for the new CSV file.
+        file_format (str): 'csv' (default), 'parquet' or 'feather'. Parquet and Feather files are smaller and
+                           much faster to read and save but are not human-readable, use export_prod_csv to get a csv copy.
 
     Returns:
         None (saves a csv file to your computer)
     """
     poke_df = pd.DataFrame(columns = ['Product_Name', 'Set_Name', 'url', 'MSRP', 'market_price', 'quantity'])
-    poke_df.to_csv('{}.csv'.format(name_of_csv), index=False)
+    save_prod_df(poke_df, '{}.{}'.format(name_of_csv, file_format))
+    return None
+
+def load_prod_df(poke_csv_name):
+    """
+    Reads your Pokémon product file with the PRODUCT_DTYPES column types. Files ending in '.parquet'
+    or '.feather' are read with pyarrow, anything else is read as csv.
+
+    Args:
+        poke_csv_name (str): The filename of the product file (including '.csv', '.parquet' or '.feather').
+
+    Returns:
+        pd.DataFrame: The df of your Pokémon products.
+    """
+    if poke_csv_name.endswith('.parquet'):
+        return apply_prod_dtypes(pd.read_parquet(poke_csv_name))
+    if poke_csv_name.endswith('.feather'):
+        return apply_prod_dtypes(pd.read_feather(poke_csv_name))
+    return pd.read_csv(poke_csv_name, dtype=PRODUCT_DTYPES)
+
+def apply_prod_dtypes(df_poke_cards):
+    """
+    Casts the columns of a product DataFrame to PRODUCT_DTYPES (columns that aren't present are skipped).
+
+    Args:
+        df_poke_cards (pd.DataFrame): The DataFrame containing Pokémon product data.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the product column types.
+    """
+    return df_poke_cards.astype({col: dtype for col, dtype in PRODUCT_DTYPES.items() if col in df_poke_cards.columns})
+
+def save_prod_df(df_poke_cards, poke_csv_name):
+    """
+    Saves your Pokémon product file in the format given by its extension ('.parquet', '.feather' or csv).
+    Parquet and Feather are binary columnar formats that save much faster than csv for large collections.
+    The file is written to a temporary file first and then swapped in, so an interrupted save
+    never leaves a half-written file behind.
+
+    Args:
+        df_poke_cards (pd.DataFrame): The DataFrame containing Pokémon product data.
+        poke_csv_name (str): The filename of the product file (including '.csv', '.parquet' or '.feather').
+
+    Returns:
+        None (saves the file to your computer)
+    """
+    tmp_name = poke_csv_name + '.tmp'
+    if poke_csv_name.endswith('.parquet'):
+        df_poke_cards.to_parquet(tmp_name, index=False, compression=PARQUET_COMPRESSION, compression_level=3)
+    elif poke_csv_name.endswith('.feather'):
+        df_poke_cards.reset_index(drop=True).to_feather(tmp_name) #feather only supports the default index
+    else:
+        with open(tmp_name, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+            df_poke_cards.to_csv(f, index=False)
+    os.replace(tmp_name, poke_csv_name)
+    return None
+
+def export_prod_csv(poke_csv_name):
+    """
+    Exports a Parquet or Feather product file to a human-readable csv file with the same base name, e.g. as a backup
+    or to open it in a spreadsheet.
+
+    Args:
+        poke_csv_name (str): The filename of your product file (including '.parquet' or '.feather').
+
+    Returns:
+        str: The filename of the exported csv file.
+    """
+    csv_name = os.path.splitext(poke_csv_name)[0] + '.csv'
+    with open(csv_name, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        load_prod_df(poke_csv_name).to_csv(f, index=False)
+    return csv_name
+
+def update_prod_csv_cell(poke_csv_name, row_index, column, value):
+    """
+    Changes a single value in a product CSV file without going through pandas. The file is streamed
+    row by row into a temporary file with only the one cell replaced (every other value is copied
+    as-is) and then swapped in, which is much cheaper than formatting the whole DataFrame with to_csv.
+
+    Args:
+        poke_csv_name (str): The filename of the CSV file (including '.csv').
+        row_index (int): Row number of the product, as in the DataFrame index (0 is the first product).
+        column (str): The column to change (e.g., 'quantity').
+        value: The new value.
+
+    Returns:
+        None (saves the csv file to your computer)
+    """
+    tmp_name = poke_csv_name + '.tmp'
+    with open(poke_csv_name, newline='', encoding='utf-8') as f_in, \
+         open(tmp_name, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f_out:
+        reader = csv.reader(f_in)
+        writer = csv.writer(f_out, lineterminator='\n')
+        header = next(reader)
+        writer.writerow(header)
+        column_position = header.index(column)
+        #Blank lines are skipped like pandas does, so row numbers match the DataFrame index
+        for i, row in enumerate(row for row in reader if row):
+            if i == row_index:
+                row[column_position] = str(value)
+            writer.writerow(row)
+    os.replace(tmp_name, poke_csv_name)
     return None
 
-def extract_price(url, label):
+def append_prod_rows(df_poke_cards, rows):
     """
-    Scrapes the given URL to extract the price corresponding to a specified label 
-    (e.g., 'PSA 10', 'Ungraded') from a PriceCharting page.
+    Appends new products to the DataFrame with a single pd.concat. Enlarging the DataFrame with
+    df.loc[len(df)] = row reallocates it for every added row, a single concat copies it once.
 
     Args:
-        url (str): The URL of the PriceCharting page for a specific Pokémon card.
+        df_poke_cards (pd.DataFrame): The existing DataFrame containing Pokémon product data.
+        rows (list of dict): The products to add, keyed by column name.
+
+    Returns:
+        pd.DataFrame: A new DataFrame with the products appended.
+    """
+    new_rows_df = apply_prod_dtypes(pd.DataFrame(rows, columns=df_poke_cards.columns))
+    if df_poke_cards.empty:
+        #A freshly created file reads back with untyped (object) columns, so start from the new rows' dtypes instead
+        return new_rows_df
+    #Name categories that differ between the two frames concat to plain objects, so cast back afterwards
+    return apply_prod_dtypes(pd.concat([df_poke_cards, new_rows_df], ignore_index=True))
+
+def fetch_soup(url):
+    """
+    Downloads a PriceCharting page once and parses it, so the product name, set name and
+    price can all be read from the same response.
+
+    Args:
+        url (str): The URL of the PriceCharting page for a specific Pokémon product.
+
+    Returns:
+        lxml.html.HtmlElement or BeautifulSoup: The parsed page (see _parse_page).
+    """
+    return _parse_page(_get_page(url).content)
+
+def _parse_page(content):
+    """
+    Parses a downloaded PriceCharting page with lxml, or with BeautifulSoup (keeping only its
+    <h1> and <td> tags) if lxml isn't installed.
+
+    Args:
+        content (bytes): The body of the response for a PriceCharting page.
+
+    Returns:
+        lxml.html.HtmlElement or BeautifulSoup: The parsed page.
+    """
+    if lxml_html is not None:
+        return lxml_html.document_fromstring(content.decode('utf-8', errors='replace'))
+    return BeautifulSoup(content, 'html.parser', parse_only=PAGE_STRAINER, from_encoding='utf-8')
+
+def extract_price(page, label):
+    """
+    Extracts the price corresponding to a specified label 
+    (e.g., 'PSA 10', 'Ungraded') from a parsed PriceCharting page.
+
+    Args:
+        page (lxml.html.HtmlElement or BeautifulSoup): The parsed page returned by fetch_soup.
         label (str): The text label used to identify the desired price row 
                      (e.g., 'PSA 10', 'Ungraded').
 
@@ -35,33 +327,34 @@ def extract_price(url, label):
         float: The extracted price as a float if found and valid.
         np.nan: If the label or price is not found or conversion to float fails.
     """
-    #Header might change based on browser
-    headers = {
-        "User-Agent": "Mozilla/5.0"
-    }
-    
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    label_td = soup.find('td', string=label)
-    if label_td:
-        price_td = label_td.find_next_sibling('td')
-        if price_td:
-            price_text = price_td.text.strip().replace('$', '').replace(',', '')
-            try:
-                return float(price_text)
-            except ValueError:
-                print(f"Couldn't convert {label} price to float.")
-                return np.nan
+    #The price is in the cell right after the one holding the label
+    if lxml_html is not None:
+        label_tds = _LABEL_TD_XPATH(page, label=label)
+        label_td = label_tds[0] if label_tds else None
+        price_td = next(label_td.itersiblings('td'), None) if label_td is not None else None
+        price_text = price_td.text_content() if price_td is not None else None
     else:
+        label_td = page.find('td', string=label)
+        price_td = label_td.find_next_sibling('td') if label_td is not None else None
+        price_text = price_td.text if price_td is not None else None
+
+    if label_td is None:
         print(f"Could not find {label} label.")
         return np.nan
-
-def extract_card_name_set(url):
+    if price_text is not None:
+        price_text = price_text.strip().replace('$', '').replace(',', '')
+        try:
+            return float(price_text)
+        except ValueError:
+            print(f"Couldn't convert {label} price to float.")
+            return np.nan
+
+def extract_card_name_set(page):
     """
-    Scrapes the given PriceCharting card URL to extract the card name and set name.
+    Extracts the product name and set name from a parsed PriceCharting page.
 
     Args:
-        url (str): The URL of the PriceCharting page for a specific Pokémon card.
+        page (lxml.html.HtmlElement or BeautifulSoup): The parsed page returned by fetch_soup.
 
     Returns:
         tuple:
@@ -69,18 +362,15 @@ def extract_card_name_set(url):
             - set_name_only (str or np.nan): The set name the card belongs to 
                                              (e.g., "Pokemon Destined Rivals").
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0"
-    }
-    
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
     # Extract the card name — it's usually in the <h1> tag
-    card_name_tag = soup.find('h1')
-    if card_name_tag:
-        card_name_and_set = card_name_tag.text.strip()
-        
+    if lxml_html is not None:
+        h1_tags = _H1_XPATH(page)
+        card_name_and_set = h1_tags[0].text_content().strip() if h1_tags else None
+    else:
+        card_name_tag = page.find('h1')
+        card_name_and_set = card_name_tag.text.strip() if card_name_tag else None
+
+    if card_name_and_set is not None:
         # Split by newline and strip each part
         parts = [part.strip() for part in card_name_and_set.split('\n') if part.strip()]
         
@@ -93,6 +383,26 @@ def extract_card_name_set(url):
         set_name_only = np.nan
     return card_name_only, set_name_only
 
+def product_in_df(df_poke_cards, product_name, set_name):
+    """
+    Checks whether a product from a given set is already in the DataFrame. Names that aren't among the
+    Product_Name/Set_Name categories can't be in any row, so new products are usually ruled out with a
+    hash lookup instead of comparing every row.
+
+    Args:
+        df_poke_cards (pd.DataFrame): The existing DataFrame containing Pokémon product data.
+        product_name (str): The name of the product.
+        set_name (str): The set name the product belongs to.
+
+    Returns:
+        bool: True if a row has both the product name and set name.
+    """
+    for column_name, value in (('Product_Name', product_name), ('Set_Name', set_name)):
+        column = df_poke_cards[column_name]
+        if isinstance(column.dtype, pd.CategoricalDtype) and value not in column.cat.categories:
+            return False
+    return bool(((df_poke_cards['Product_Name'] == product_name) & (df_poke_cards['Set_Name'] == set_name)).any())
+
 def add_product(df_poke_cards, url, poke_csv_name):
     """
     Adds a new Pokemon product to the DataFrame and updates the CSV file if the product is not already present.
@@ -106,19 +416,20 @@ def add_product(df_poke_cards, url, poke_csv_name):
     Returns:
         pd.DataFrame: The updated DataFrame, either with a new card added or with prices optionally updated.
     """
-    # Get the card name and set name
-    check_card_name, set_name_only = extract_card_name_set(url)
+    # Get the card name and set name (the same page also has the price)
+    page = fetch_soup(url)
+    check_card_name, set_name_only = extract_card_name_set(page)
     
-    if ((df_poke_cards['Product_Name'] == check_card_name) & (df_poke_cards['Set_Name'] == set_name_only)).any():
+    if product_in_df(df_poke_cards, check_card_name, set_name_only):
         print(f"{check_card_name} from {set_name_only} is present in spreadsheet.")
         #Want to either update price or quantity
         choice_input = input("Would you like to:\n1. Update price? \n2. Update quantity?\n").strip()
-        while not (choice_input.isdigit() and (int(choice_input) == 1 or int(choice_input) == 2)):
+        while not _CHOICE_RE.fullmatch(choice_input):
             choice_input = input("Not a valid choice! Choose 1 or 2!:\n").strip()
         #Call diff. function based on choice above
-        if int(choice_input) == 1:
+        if choice_input == '1':
             df_poke_cards = update_price_prod(df_poke_cards, check_card_name, set_name_only, poke_csv_name)
-        elif int(choice_input) == 2:
+        elif choice_input == '2':
             df_poke_cards = update_quantity_prod(df_poke_cards, check_card_name, set_name_only, poke_csv_name)
         else:
             print('No new product added nor price updated.')
@@ -126,7 +437,7 @@ def add_product(df_poke_cards, url, poke_csv_name):
         print(f"{check_card_name} from {set_name_only} is not present in the 'Product_Name' column. Adding product:")
         
         # Extract prices and determine if we should grade it
-        product_price = extract_price(url, 'Ungraded')
+        product_price = extract_price(page, 'Ungraded')
         msrp_input = input("What is the MSRP? - ") #its a price we paid for at the time, often a decimal
         quantity_input = input("How many do you own? - ") #single number
 
@@ -147,8 +458,8 @@ def add_product(df_poke_cards, url, poke_csv_name):
                    'MSRP': msrp_input_float, 'market_price': product_price, 'quantity': quantity_input_float}
         
         # Append the row (returns a new DataFrame)
-        df_poke_cards.loc[len(df_poke_cards)] = new_row
-        df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+        df_poke_cards = append_prod_rows(df_poke_cards, [new_row])
+        save_prod_df(df_poke_cards, poke_csv_name) #resave new dataframe
         
     return df_poke_cards
 
@@ -167,20 +478,29 @@ def update_price_prod(df_poke_cards, card_name, set_name, poke_csv_name):
     Returns:
         pd.DataFrame: The updated DataFrame with revised price and grading information for the specified product.
     """
+    #Find the product's row(s) once and reuse the mask
+    product_mask = (df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name)
+
     #Extract url
-    url = df_poke_cards.loc[(df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'url'].values[0]
+    url = df_poke_cards.loc[product_mask, 'url'].values[0]
     
     # Extract prices
-    product_price = extract_price(url, 'Ungraded')
+    #A price update you ask for always downloads the current page rather than a cached copy
+    try:
+        product_price = fetch_product_price(url, fresh=True)
+    except requests.RequestException as error:
+        #Nothing was downloaded, so keep the stored price and leave the file as it is
+        print(f"Couldn't download {url} ({error}). Price not updated.")
+        return df_poke_cards
         
     # Display results
     print(f"Url: {url}")
     print(f"Market Price: {product_price} \n")
     
     #Update df
-    df_poke_cards.loc[(df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'market_price'] = product_price
+    df_poke_cards.loc[product_mask, 'market_price'] = product_price
     
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    save_prod_df(df_poke_cards, poke_csv_name) #resave new dataframe
         
     return df_poke_cards
 
@@ -200,23 +520,24 @@ def update_quantity_prod(df_poke_cards, card_name, set_name, poke_csv_name):
         pd.DataFrame: The updated DataFrame with quantity.
     """
     #First it prints how many you own right now. You can either update it by adding one or manually tell how many you have now.
-    quant_owned = df_poke_cards.loc[(df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'quantity'].values[0]
+    product_mask = (df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name)
+    quant_owned = df_poke_cards.loc[product_mask, 'quantity'].values[0]
     print(f"You currently have {quant_owned} of these cards.")
 
     #Next we have an input choice for quantity
     quant_input = input("Would you like to:\n1.Add one? \n2.Update manually?\n").strip()
-    while not (quant_input.isdigit() and (int(quant_input) == 1 or int(quant_input) == 2)):
+    while not _CHOICE_RE.fullmatch(quant_input):
         quant_input = input("Not a valid choice! Choose 1 or 2!:\n").strip()
     
     if quant_input == '1':
-        df_poke_cards.loc[(df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'quantity'] = quant_owned + 1
+        df_poke_cards.loc[product_mask, 'quantity'] = quant_owned + 1
     elif quant_input == '2':
         quant_choice = input("How many of the card do you own?: ").strip()
-        while not (quant_choice.isdigit()):
+        while not _INT_RE.fullmatch(quant_choice):
             quant_choice = input("Not a valid choice! Input only an integer: ").strip()
-        df_poke_cards.loc[(df_poke_cards['Product_Name'] == card_name) & (df_poke_cards['Set_Name'] == set_name), 'quantity'] = int(quant_choice)
+        df_poke_cards.loc[product_mask, 'quantity'] = int(quant_choice)
     
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    save_prod_df(df_poke_cards, poke_csv_name) #resave new dataframe
 
     return df_poke_cards
 
@@ -230,11 +551,11 @@ def user_update_quantity_prod(poke_csv_name):
     Returns:
         pandas.DataFrame: The updated DataFrame after modifying the quantity.
     """
-    df_poke_cards = pd.read_csv(poke_csv_name)
+    df_poke_cards = load_prod_df(poke_csv_name)
     user_input = input("Enter row index to update quantity: ").strip()
     
     # Validate that input is an integer
-    if not user_input.isdigit():
+    if not _INT_RE.fullmatch(user_input):
         print("Please enter a valid numeric index.")
         return df_poke_cards
     
@@ -254,7 +575,11 @@ def user_update_quantity_prod(poke_csv_name):
 
     # Save updated DataFrame
     print('Saving csv file.')
-    df_poke_cards.to_csv(poke_csv_name, index=False) #resave new dataframe
+    if poke_csv_name.endswith(('.parquet', '.feather')):
+        save_prod_df(df_poke_cards, poke_csv_name) #resave new dataframe
+    else:
+        #Only one cell changed, so patch that row in the csv file instead of rewriting the whole DataFrame
+        update_prod_csv_cell(poke_csv_name, index_to_drop, 'quantity', quantity_input_float)
     return df_poke_cards
 
 def update_poke_prod_df(poke_csv_name):
@@ -271,7 +596,7 @@ def update_poke_prod_df(poke_csv_name):
                               None if the operation is aborted due to invalid input or no matching card found.
     """
     #must already have using the same name as you did in new_pokemon_df
-    cards_df = pd.read_csv(poke_csv_name)
+    cards_df = load_prod_df(poke_csv_name)
     #Strip is used to clean out empty spaces in the beginning or end of the 
     url_or_name = input("Enter URL - ").strip() #asks what the user input is to determine next function
 
@@ -285,12 +610,72 @@ def update_poke_prod_df(poke_csv_name):
 
     return cards_df
 
-def multi_update_price_poke_product_df(poke_csv_name):
-    #must already have using the same name as you did in new_pokemon_df
-    cards_df = pd.read_csv(poke_csv_name)
+def fetch_product_price(url, fresh=False):
+    """
+    Scrapes the Ungraded (market) price for a product. The price is read directly from the
+    page with a regular expression, and the page is only parsed if that doesn't find it.
+
+    Args:
+        url (str): The URL of the PriceCharting page for a specific Pokémon product.
+        fresh (bool): Skip requests_cache and download the current page (default False, see _get_page).
 
-    for i in range(0, len(cards_df)):
-        cards_df = update_price_prod(cards_df, cards_df['Product_Name'][i], cards_df['Set_Name'][i], poke_csv_name)
-        time.sleep(random.uniform(2.0, 4.0)) #add a time delay to prevent bot detection and to properly use this function
+    Returns:
+        float: The market price, or np.nan if it could not be found on the page.
+
+    Raises:
+        requests.RequestException: If the page could not be downloaded (timeout, connection error,
+                                   or an error status that was still returned after the retries).
+    """
+    response = _get_page(url, fresh=fresh)
+    #An error page has no price, and a NaN would be saved over the product's stored price
+    response.raise_for_status()
+    price_match = _UNGRADED_PRICE_RE.search(response.content)
+    if price_match:
+        return float(price_match.group(1).replace(b',', b''))
+    #Missing or unusual price (e.g. '-'), parsing reports why
+    return extract_price(_parse_page(response.content), 'Ungraded')
+
+def multi_update_price_poke_product_df(poke_csv_name, max_workers=MAX_CONCURRENT_SCRAPES):
+    """
+    Updates the market price of every product in the CSV file. Product pages are scraped
+    concurrently by a pool of threads and the CSV file is saved once with all the new prices.
+    If a product's page can't be downloaded, its url is printed and its old price is kept.
+    Requests to PriceCharting are still spaced out (see wait_for_host), pages already in the cache are not.
 
-    return cards_df
\ No newline at end of file
+    Args:
+        poke_csv_name (str): The filename (including .csv extension) of the Pokémon product file to update.
+        max_workers (int): How many product pages to scrape at the same time (default MAX_CONCURRENT_SCRAPES).
+
+    Returns:
+        pd.DataFrame: The updated DataFrame with revised market prices for every product.
+    """
+    #must already have using the same name as you did in new_pokemon_df
+    cards_df = load_prod_df(poke_csv_name)
+
+    def fetch_price_or_error(url):
+        #One product failing (site error, timeout, bad url) shouldn't throw away the new prices of every other product,
+        #so the error is handed back instead of raised out of executor.map
+        try:
+            return fetch_product_price(url)
+        except requests.RequestException as error:
+            return error
+
+    #Requests spend nearly all their time waiting on the network, so threads overlap them well.
+    #Results come back in row order, so progress prints the same as before.
+    prices = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for url, old_price, product_price in zip(cards_df['url'], cards_df['market_price'],
+                                                 executor.map(fetch_price_or_error, cards_df['url'])):
+            print(f"Url: {url}")
+            if isinstance(product_price, Exception):
+                print(f"Couldn't update this product ({product_price}). Keeping its old price. \n")
+                product_price = old_price
+            else:
+                print(f"Market Price: {product_price} \n")
+            prices.append(product_price)
+
+    #Write all the scraped prices back as one column instead of cell by cell
+    cards_df['market_price'] = np.array(prices, dtype=float)
+
+    save_prod_df(cards_df, poke_csv_name) #resave new dataframe once with every price
+    return cards_df
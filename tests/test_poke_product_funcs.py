@@ -0,0 +1,100 @@
+import contextlib
+import io
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts_and_files'))
+import poke_product_funcs_v2 as prod
+
+#Ungraded prices served by the local site for each working product page
+PAGE_PRICES = {'/booster-box': '1,234.56', '/elite-trainer-box': '45.00'}
+
+class _PriceCharting(BaseHTTPRequestHandler):
+    #Serves a minimal price table for the pages in PAGE_PRICES, and 503 for anything else (e.g. '/down')
+    def do_GET(self):
+        if self.path in PAGE_PRICES:
+            body = ('<h1>Product\nPokemon Destined Rivals</h1><table><tr><td>Ungraded</td>'
+                    '<td>${}</td></tr></table>').format(PAGE_PRICES[self.path]).encode()
+            self.send_response(200)
+        else:
+            body = b'Service Unavailable'
+            self.send_response(503)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+class FailingProductPageTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _PriceCharting)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        #Fresh session with its cache in the temporary folder, no spacing between requests
+        patches = [mock.patch.object(prod, 'CACHE_DIR', self.tmp_dir.name),
+                   mock.patch.object(prod, '_SESSION', None),
+                   mock.patch.object(prod, 'MIN_REQUEST_INTERVAL', 0),
+                   mock.patch('time.sleep')] #skips the retry backoff
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        #Send the local http pages through the same retrying adapter as PriceCharting's https pages
+        session = prod._get_session()
+        session.mount('http://', session.get_adapter('https://'))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def _save_products(self, names, urls):
+        #Product file whose market prices are all 1.0 before the update
+        csv_name = os.path.join(self.tmp_dir.name, 'products.csv')
+        prod.save_prod_df(prod.apply_prod_dtypes(prod.pd.DataFrame({
+            'Product_Name': names, 'Set_Name': 'Pokemon Destined Rivals', 'url': urls,
+            'MSRP': 100.0, 'market_price': 1.0, 'quantity': 1})), csv_name)
+        return csv_name
+
+    def test_failing_urls_mid_batch_keep_their_old_prices(self):
+        urls = [self.base + '/booster-box',
+                self.base + '/down', #keeps answering 503
+                'http://127.0.0.1:{}/refused'.format(_closed_port()), #nothing listening
+                self.base + '/elite-trainer-box']
+        csv_name = self._save_products(['Booster Box', 'Down', 'Refused', 'Elite Trainer Box'], urls)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            updated_df = prod.multi_update_price_poke_product_df(csv_name)
+
+        #The two failing rows keep the price they had before the update
+        expected = [1234.56, 1.0, 1.0, 45.0]
+        np.testing.assert_array_equal(updated_df['market_price'].to_numpy(), expected)
+        np.testing.assert_array_equal(prod.load_prod_df(csv_name)['market_price'].to_numpy(), expected)
+
+    def test_failing_single_update_keeps_the_file(self):
+        csv_name = self._save_products(['Down'], [self.base + '/down'])
+        file_before = open(csv_name, 'rb').read()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            updated_df = prod.update_price_prod(prod.load_prod_df(csv_name), 'Down', 'Pokemon Destined Rivals', csv_name)
+
+        self.assertEqual(updated_df['market_price'].tolist(), [1.0])
+        self.assertEqual(open(csv_name, 'rb').read(), file_before)
+
+if __name__ == '__main__':
+    unittest.main()